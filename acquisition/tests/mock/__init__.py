@@ -6,6 +6,8 @@ from bisect import bisect_left
 
 
 url = 'https://data.kitware.com/api/v1/file'
+# Reuse one connection to data.kitware.com across downloads
+session = requests.Session()
 
 
 def angle_to_page(angle):
@@ -26,7 +28,7 @@ def test_image():
     cache = diskcache.Cache(cache_path)
 
     if download_url not in cache:
-        response = requests.get(download_url, stream=True)
+        response = session.get(download_url, stream=True)
         response.raise_for_status()
         cache.set(download_url, response.raw, read=True)
 
@@ -41,7 +43,7 @@ def test_black_image():
     cache = diskcache.Cache(cache_path)
 
     if download_url not in cache:
-        response = requests.get(download_url, stream=True)
+        response = session.get(download_url, stream=True)
         response.raise_for_status()
         cache.set(download_url, response.raw, read=True)
 
@@ -67,13 +69,13 @@ def test_dm3_tilt_series():
     def gen():
         for _id in _ids:
             file_url = '%s/%s' % (url, _id)
-            response = requests.get(file_url)
+            response = session.get(file_url)
             response.raise_for_status()
             name = response.json()['name']
             download_url = '%s/download' % file_url
 
             if name not in cache:
-                response = requests.get(download_url, stream=True)
+                response = session.get(download_url, stream=True)
                 response.raise_for_status()
                 cache.set(name, response.raw, read=True)
 
@@ -180,9 +180,20 @@ class PassiveWatchSource(AbstractSource):
         self._validate_connection_params(path, fileNameRegex,
                                          fileNameRegexGroups,
                                          groupRegexSubstitutions)
-        self._filename_regex = fileNameRegex
+        # Compile the regexes once here rather than for every file we extract
+        # metadata from.
+        self._filename_regex = None
+        if fileNameRegex is not None:
+            self._filename_regex = re.compile(fileNameRegex)
         self._filename_regex_groups = fileNameRegexGroups
-        self._group_regex_substitutions = groupRegexSubstitutions
+        self._group_regex_substitutions = None
+        if groupRegexSubstitutions is not None:
+            self._group_regex_substitutions = {
+                group: [(re.compile(regex), repl)
+                        for sub in substitutions
+                        for regex, repl in iteritems(sub)]
+                for group, substitutions in iteritems(groupRegexSubstitutions)
+            }
         self._monitor = Monitor(path, filename_regex=fileNameRegex,
                                 valid_file_check=_valid_file_check)
 
@@ -221,7 +232,7 @@ class PassiveWatchSource(AbstractSource):
         pass
 
     def _extract_filename_metadata(self, filepath):
-        match = re.search(self._filename_regex, filepath)
+        match = self._filename_regex.search(filepath)
         if match is None:
             return {}
 
@@ -233,9 +244,8 @@ class PassiveWatchSource(AbstractSource):
         if self._group_regex_substitutions is not None:
             for group, substitutions in iteritems(
                     self._group_regex_substitutions):
-                for sub in substitutions:
-                    for regex, repl in iteritems(sub):
-                        meta[group] = re.sub(regex, repl, meta[group])
+                for regex, repl in substitutions:
+                    meta[group] = regex.sub(repl, meta[group])
 
         meta['fileName'] = os.path.basename(filepath)
         return meta
@@ -28,13 +28,15 @@ downloads = [{
 }]
 
 girder_url = 'https://data.kitware.com/api/v1'
+# Reuse one connection to Girder for the hashsum checks and downloads
+session = requests.Session()
 
 
 def is_cached(id):
     sha_path = '%s.sha512' % download['name']
     if os.path.exists(sha_path):
         url = '%s/file/%s/hashsum_file/sha512' % (girder_url, download['_id'])
-        response = requests.get(url)
+        response = session.get(url)
         sha = response.content
 
         with open(sha_path) as fp:
@@ -68,7 +70,7 @@ CHUNK_SIZE = 16 * 1024
 
 def cache_download(download):
     url = '%s/file/%s/download' % (girder_url, download['_id'])
-    response = requests.get(url, stream=True)
+    response = session.get(url, stream=True)
 
     sha = hashlib.sha512()
     name = download['name']